@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Import passages from arbitrary text files into the quote corpus"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from collections import deque
+from multiprocessing import Pool
+from typing import Deque, Dict, Iterator, List, Set, Tuple
+
+from quote_lengths import LENGTH_CATEGORIES
+
+CORPUS_FILE = "english.json"
+READ_SIZE = 1 << 20
+MAX_PENDING_BLOCKS = 16
+
+SENTENCE_END = re.compile(r'[.!?]+["\')\]]*(?=\s|$)')
+PARAGRAPH_BREAK = re.compile(r'\n[ \t]*\r?\n')
+WHITESPACE = re.compile(r'\s+')
+
+def passage_hash(text: str) -> int:
+    """Hash a passage to a 64-bit key so that case and spacing differences dedupe together"""
+    normalized = WHITESPACE.sub(' ', text).strip().lower()
+    return int.from_bytes(hashlib.sha1(normalized.encode('utf-8')).digest()[:8], 'big')
+
+def _last_boundary(buffer: str) -> int:
+    """Get the offset just past the last paragraph break, sentence end or line end"""
+    cut = 0
+    for match in PARAGRAPH_BREAK.finditer(buffer):
+        cut = match.end()
+    if not cut:
+        for match in SENTENCE_END.finditer(buffer):
+            cut = match.end()
+    if not cut:
+        cut = buffer.rfind('\n') + 1
+    return cut
+
+def read_blocks(path: str, read_size: int = READ_SIZE) -> Iterator[str]:
+    """Stream a text file as blocks that end on a paragraph, sentence or line boundary"""
+    carry = ""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            chunk = f.read(read_size)
+            if not chunk:
+                break
+            buffer = carry + chunk
+            cut = _last_boundary(buffer)
+            if not cut and len(buffer) > read_size:
+                # No boundary in sight; fall back to the last whitespace
+                cut = buffer.rfind(' ') + 1 or len(buffer)
+            if cut:
+                yield buffer[:cut]
+                carry = buffer[cut:]
+            else:
+                carry = buffer
+    if carry.strip():
+        yield carry
+
+def _split_long(text: str, max_length: int) -> List[str]:
+    """Split text longer than max_length at whitespace into pieces that fit"""
+    pieces = []
+    current = ""
+    for word in text.split(' '):
+        while len(word) > max_length:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_length])
+            word = word[max_length:]
+        candidate = f"{current} {word}" if current else word
+        if len(candidate) > max_length:
+            pieces.append(current)
+            candidate = word
+        current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+def split_units(text: str, max_length: int) -> List[Tuple[str, bool]]:
+    """Split a block of text into whitespace-normalized units no longer than max_length
+
+    Units end at sentence ends, line ends and paragraph breaks. Each unit is
+    paired with whether it ends a sentence or paragraph, which makes it a
+    natural place to end a passage; a line that merely wraps does not.
+    """
+    units = []
+    for paragraph in PARAGRAPH_BREAK.split(text):
+        paragraph_units = []
+        for line in paragraph.splitlines():
+            start = 0
+            for match in SENTENCE_END.finditer(line):
+                paragraph_units.append((line[start:match.end()], True))
+                start = match.end()
+            paragraph_units.append((line[start:], False))
+        
+        paragraph_units = [(WHITESPACE.sub(' ', unit).strip(), terminal)
+                           for unit, terminal in paragraph_units]
+        paragraph_units = [(unit, terminal) for unit, terminal in paragraph_units if unit]
+        if paragraph_units:
+            unit, _ = paragraph_units[-1]
+            paragraph_units[-1] = (unit, True)
+        
+        for unit, terminal in paragraph_units:
+            if len(unit) <= max_length:
+                units.append((unit, terminal))
+                continue
+            pieces = _split_long(unit, max_length)
+            units.extend((piece, False) for piece in pieces[:-1])
+            units.append((pieces[-1], terminal))
+    return units
+
+def chunk_block(args: Tuple[str, str]) -> List[Tuple[str, int]]:
+    """Pack the units of a block into passages that fit a length category
+
+    Passages end at sentence or paragraph ends once they reach the minimum
+    length, or wherever the next unit would overflow the maximum. Returns
+    (text, hash) pairs so hashing also happens in the worker.
+    """
+    block, category = args
+    min_length, max_length = LENGTH_CATEGORIES[category]
+    passages = []
+    current = ""
+    for unit, terminal in split_units(block, max_length):
+        candidate = f"{current} {unit}" if current else unit
+        if len(candidate) > max_length:
+            if len(current) >= min_length:
+                passages.append((current, passage_hash(current)))
+            candidate = unit
+        current = candidate
+        if terminal and len(current) >= min_length:
+            passages.append((current, passage_hash(current)))
+            current = ""
+    if current and len(current) >= min_length:
+        passages.append((current, passage_hash(current)))
+    return passages
+
+def iter_passages(paths: List[str], category: str, workers: int) -> Iterator[Tuple[str, int, str]]:
+    """Yield (text, hash, path) for every passage, chunking blocks across a process pool
+
+    At most MAX_PENDING_BLOCKS blocks are in flight at once so memory stays
+    bounded regardless of input size.
+    """
+    with Pool(processes=workers) as pool:
+        for path in paths:
+            pending: Deque = deque()
+            for block in read_blocks(path):
+                pending.append(pool.apply_async(chunk_block, ((block, category),)))
+                if len(pending) >= MAX_PENDING_BLOCKS:
+                    for text, digest in pending.popleft().get():
+                        yield text, digest, path
+            while pending:
+                for text, digest in pending.popleft().get():
+                    yield text, digest, path
+
+def _detect_newline(path: str) -> str:
+    """Get the line ending used by an existing file, defaulting to LF"""
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return '\r\n' if f.readline().endswith('\r\n') else '\n'
+    except FileNotFoundError:
+        return '\n'
+
+def _format_field(value) -> str:
+    """Format a top-level corpus field, keeping nested arrays like groups on one line each"""
+    if isinstance(value, list) and value and all(isinstance(item, list) for item in value):
+        rows = ",\n".join("    " + json.dumps(item, ensure_ascii=False) for item in value)
+        return "[\n" + rows + "\n  ]"
+    return json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+
+def _write_quote(f, quote: Dict, first: bool):
+    """Write a single quote object in the corpus file's indentation"""
+    body = json.dumps(quote, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+    f.write(("    " if first else ",\n    ") + body)
+
+def import_files(paths: List[str], category: str = "medium", source: str | None = None,
+                 corpus_file: str = CORPUS_FILE, workers: int | None = None) -> Dict[str, int]:
+    """Import passages from text files into the corpus, returning how many were added per file"""
+    try:
+        with open(corpus_file, 'r', encoding='utf-8') as f:
+            corpus = json.load(f)
+    except FileNotFoundError:
+        corpus = {"language": "english", "quotes": []}
+    corpus.setdefault("groups", [list(bounds) for bounds in LENGTH_CATEGORIES.values()])
+    existing = corpus.pop("quotes", [])
+
+    seen: Set[int] = {passage_hash(q['text']) for q in existing}
+    next_id = max((q.get('id', 0) for q in existing), default=0) + 1
+    added = {path: 0 for path in paths}
+
+    newline = _detect_newline(corpus_file)
+    corpus_dir = os.path.dirname(os.path.abspath(corpus_file))
+    fd, tmp_path = tempfile.mkstemp(dir=corpus_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline=newline) as f:
+            f.write("{\n")
+            for key, value in corpus.items():
+                f.write(f"  {json.dumps(key)}: {_format_field(value)},\n")
+            f.write('  "quotes": [\n')
+            first = True
+            for quote in existing:
+                _write_quote(f, quote, first)
+                first = False
+            del existing
+
+            for text, digest, path in iter_passages(paths, category, workers or os.cpu_count() or 1):
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                quote = {
+                    "text": text,
+                    "source": source or os.path.splitext(os.path.basename(path))[0],
+                    "length": len(text),
+                    "id": next_id
+                }
+                _write_quote(f, quote, first)
+                first = False
+                next_id += 1
+                added[path] += 1
+            f.write("\n  ]\n}")
+        if os.path.exists(corpus_file):
+            os.chmod(tmp_path, os.stat(corpus_file).st_mode)
+        os.replace(tmp_path, corpus_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return added
+
+def main():
+    """Entry point"""
+    parser = argparse.ArgumentParser(description="Import text files into the quote corpus")
+    parser.add_argument("files", nargs="+", help="text files to import")
+    parser.add_argument("--category", choices=list(LENGTH_CATEGORIES), default="medium",
+                        help="quote length category to chunk passages into")
+    parser.add_argument("--source", help="source to attribute passages to (default: file name)")
+    parser.add_argument("--corpus", default=CORPUS_FILE, help="corpus JSON file to merge into")
+    parser.add_argument("--workers", type=int, help="number of chunking processes")
+    args = parser.parse_args()
+
+    try:
+        added = import_files(args.files, args.category, args.source, args.corpus, args.workers)
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    for path, count in added.items():
+        if not count:
+            print(f"Warning: no new {args.category} passages found in {path}", file=sys.stderr)
+    print(f"Imported {sum(added.values())} new {args.category} passages into {args.corpus}")
+
+if __name__ == "__main__":
+    main()
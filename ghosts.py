@@ -0,0 +1,66 @@
+"""Ghost runs for racing against a personal best"""
+
+import os
+from array import array
+from bisect import bisect_right
+from typing import List
+
+GHOSTS_DIR = "ghosts"
+TIMELINE_TYPECODE = 'I'
+
+class Ghost:
+    """A recorded run stored as cumulative millisecond timestamps
+    
+    timeline[i] is the time at which the cursor first reached position i + 1,
+    so the array is sorted and the ghost's position is found by binary search.
+    """
+    
+    def __init__(self, timeline: array):
+        self.timeline = timeline
+    
+    def position_at(self, elapsed: float) -> int:
+        """Get the number of characters the ghost had typed after elapsed seconds"""
+        return bisect_right(self.timeline, int(elapsed * 1000))
+    
+    @property
+    def finish_time(self) -> float:
+        """Total time of the recorded run in seconds"""
+        return self.timeline[-1] / 1000 if self.timeline else 0.0
+
+def _ghost_path(quote_id: int) -> str:
+    """Get the file a quote's ghost timeline is stored in"""
+    return os.path.join(GHOSTS_DIR, f"{quote_id}.bin")
+
+def load_ghost(quote_id: int) -> Ghost | None:
+    """Load the personal best ghost for a quote, if one has been recorded"""
+    path = _ghost_path(quote_id)
+    if not os.path.exists(path):
+        return None
+    timeline = array(TIMELINE_TYPECODE)
+    try:
+        with open(path, 'rb') as f:
+            timeline.fromfile(f, os.path.getsize(path) // timeline.itemsize)
+    except (IOError, EOFError):
+        return None
+    return Ghost(timeline) if timeline else None
+
+def save_ghost(quote_id: int, timeline: List[float]) -> bool:
+    """Save a completed run as the quote's ghost if it beats the current one
+
+    Callers must only pass runs whose final input matches the quote exactly.
+    """
+    if not timeline:
+        return False
+
+    new_ghost = Ghost(array(TIMELINE_TYPECODE, (int(t * 1000) for t in timeline)))
+    current = load_ghost(quote_id)
+    if current and current.finish_time <= new_ghost.finish_time:
+        return False
+
+    try:
+        os.makedirs(GHOSTS_DIR, exist_ok=True)
+        with open(_ghost_path(quote_id), 'wb') as f:
+            new_ghost.timeline.tofile(f)
+    except IOError:
+        return False
+    return True
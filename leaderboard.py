@@ -2,14 +2,49 @@
 
 import json
 import os
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 LEADERBOARD_FILE = "leaderboard.json"
+STATS_FILE = "leaderboard_stats.json"
+TREND_WINDOW = 10
+
+@dataclass
+class PlayerStats:
+    """Running aggregates for one player in one quote length category"""
+    name: str
+    quote_length: str
+    count: int = 0
+    mean_wpm: float = 0.0
+    best_wpm: float = 0.0
+    mean_accuracy: float = 0.0
+    recent_wpm: List[float] = field(default_factory=list)
+    
+    def update(self, wpm: float, accuracy: float):
+        """Fold a new result into the aggregates in constant time"""
+        self.count += 1
+        self.mean_wpm += (wpm - self.mean_wpm) / self.count
+        self.mean_accuracy += (accuracy - self.mean_accuracy) / self.count
+        self.best_wpm = max(self.best_wpm, wpm)
+        self.recent_wpm.append(wpm)
+        if len(self.recent_wpm) > TREND_WINDOW:
+            self.recent_wpm.pop(0)
+    
+    @property
+    def trend(self) -> float:
+        """Change in average WPM between the older and newer half of recent results"""
+        half = len(self.recent_wpm) // 2
+        if not half:
+            return 0.0
+        older = self.recent_wpm[:half]
+        newer = self.recent_wpm[-half:]
+        return sum(newer) / half - sum(older) / half
 
 class Leaderboard:
     def __init__(self):
         self.scores = self._load_scores()
+        self.stats = self._load_stats()
     
     def _load_scores(self) -> List[Dict]:
         """Load scores from JSON file"""
@@ -29,6 +64,32 @@ class Leaderboard:
         except IOError:
             pass
     
+    def _load_stats(self) -> Dict[Tuple[str, str], PlayerStats]:
+        """Load aggregates from JSON file
+        
+        Aggregates start empty when the file is missing: the saved scores only
+        keep the top 50, so rebuilding from them would skew every average.
+        """
+        stats: Dict[Tuple[str, str], PlayerStats] = {}
+        if os.path.exists(STATS_FILE):
+            try:
+                with open(STATS_FILE, 'r') as f:
+                    entries = json.load(f)
+                for entry in entries:
+                    player_stats = PlayerStats(**entry)
+                    stats[(player_stats.name, player_stats.quote_length)] = player_stats
+            except (json.JSONDecodeError, IOError, TypeError):
+                return {}
+        return stats
+    
+    def _save_stats(self):
+        """Save aggregates to JSON file"""
+        try:
+            with open(STATS_FILE, 'w') as f:
+                json.dump([asdict(s) for s in self.stats.values()], f, indent=2)
+        except IOError:
+            pass
+    
     def add_score(self, name: str, wpm: float, accuracy: float, quote_length: str):
         """Add a new score to the leaderboard"""
         score_entry = {
@@ -42,6 +103,12 @@ class Leaderboard:
         self.scores.sort(key=lambda x: x['wpm'], reverse=True)
         self.scores = self.scores[:50]
         self._save_scores()
+        
+        key = (name, quote_length)
+        if key not in self.stats:
+            self.stats[key] = PlayerStats(name, quote_length)
+        self.stats[key].update(score_entry['wpm'], score_entry['accuracy'])
+        self._save_stats()
     
     def get_top_scores(self, limit: int = 10, quote_length: str | None = None) -> List[Dict]:
         """Get top scores, optionally filtered by quote length"""
@@ -49,3 +116,9 @@ class Leaderboard:
             filtered = [s for s in self.scores if s['quote_length'] == quote_length]
             return filtered[:limit]
         return self.scores[:limit]
+    
+    def get_player_stats(self, quote_length: str | None = None) -> List[PlayerStats]:
+        """Get per-player aggregates sorted by best WPM, optionally filtered by quote length"""
+        stats = [s for s in self.stats.values()
+                 if not quote_length or s.quote_length == quote_length]
+        return sorted(stats, key=lambda s: s.best_wpm, reverse=True)
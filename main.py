@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Colorful CLI Typing Speed Test - MonkeyType Style"""
 
+import copy
 import sys
 import readchar
+from typing import List
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -13,8 +15,9 @@ from rich import box
 from rich.align import Align
 
 from quotes import get_random_quote, Quote
-from typing_engine import TypingEngine
+from typing_engine import TypingEngine, ResultsSummary
 from leaderboard import Leaderboard
+from ghosts import Ghost, load_ghost, save_ghost
 
 console = Console()
 
@@ -23,6 +26,7 @@ class TypingTest:
         self.leaderboard = Leaderboard()
         self.quote_length = "medium"
         self.current_quote = None
+        self.ghost_mode = False
     
     def show_banner(self):
         """Display colorful banner with rounded corners"""
@@ -49,6 +53,9 @@ class TypingTest:
         menu_content.append("Change Quote Length ", style="blue")
         menu_content.append(f"(Current: {self.quote_length})\n", style="dim")
         menu_content.append("4. ", style="bold yellow")
+        menu_content.append("Ghost Racer ", style="bright_cyan")
+        menu_content.append(f"({'On' if self.ghost_mode else 'Off'})\n", style="dim")
+        menu_content.append("5. ", style="bold yellow")
         menu_content.append("Exit", style="red")
         
         menu_panel = Panel(
@@ -61,7 +68,7 @@ class TypingTest:
         
         console.print(Align.center(menu_panel))
         console.print()
-        console.print(Align.center("[dim]Press 1-4 to select[/]"))
+        console.print(Align.center("[dim]Press 1-5 to select[/]"))
     
     def select_quote_length(self):
         """Let user select quote length"""
@@ -112,16 +119,24 @@ class TypingTest:
             except:
                 pass
     
-    def display_typing_area(self, engine: TypingEngine, quote: Quote):
-        """Display the typing area with colored characters"""
+    def display_typing_area(self, engine: TypingEngine, quote: Quote, ghosts: List[Ghost] | None = None):
+        """Display the typing area with colored characters and ghost cursors"""
         char_status = engine.get_current_char_status()
         
         text = Text()
         cursor_pos = len(engine.user_input)
+        elapsed = engine.get_elapsed_time()
+        ghosts = ghosts or []
+        # Ghosts wait for the timer and never cover characters the player has typed
+        ghost_positions = set()
+        if engine.start_time:
+            ghost_positions = {ghost.position_at(elapsed) for ghost in ghosts}
         
         for i, (char, status) in enumerate(char_status):
             if i == cursor_pos:
                 text.append(char, style="bold black on yellow")
+            elif i > cursor_pos and i in ghost_positions:
+                text.append(char, style="bold black on bright_cyan")
             elif status == 'correct':
                 text.append(char, style="bold green")
             elif status == 'incorrect':
@@ -130,6 +145,8 @@ class TypingTest:
                 text.append(char, style="dim white")
         
         title = f"[bold cyan]Type the text below[/]  [dim]│[/]  [italic magenta]{quote.source}[/]"
+        if ghosts:
+            title += f"  [dim]│[/]  [bold bright_cyan]👻 Best: {min(g.finish_time for g in ghosts):.1f}s[/]"
         
         return Panel(
             text,
@@ -187,18 +204,26 @@ class TypingTest:
         
         self.current_quote = get_random_quote(self.quote_length)
         engine = TypingEngine(self.current_quote.text)
+        ghosts = self.load_ghosts(self.current_quote)
         
         timer_started = False
         
-        with Live(console=console, refresh_per_second=10) as live:
+        def render():
+            # Render from a snapshot: the refresh thread must not see the engine mid-keystroke
+            snapshot = copy.copy(engine)
+            layout = Layout()
+            layout.split_column(
+                Layout(self.display_typing_area(snapshot, self.current_quote, ghosts), size=12),
+                Layout(self.display_stats(snapshot), size=4),
+                Layout(self.display_hint(), size=3)
+            )
+            return layout
+        
+        # With ghosts, Live also re-renders on its own refresh thread so they keep moving between keystrokes
+        with Live(console=console, refresh_per_second=10, auto_refresh=self.ghost_mode,
+                  get_renderable=render) as live:
             while not engine.is_complete():
-                layout = Layout()
-                layout.split_column(
-                    Layout(self.display_typing_area(engine, self.current_quote), size=12),
-                    Layout(self.display_stats(engine), size=4),
-                    Layout(self.display_hint(), size=3)
-                )
-                live.update(layout)
+                live.refresh()
                 
                 try:
                     key = readchar.readchar()
@@ -209,6 +234,7 @@ class TypingTest:
                     elif key == '\t':
                         self.current_quote = get_random_quote(self.quote_length)
                         engine = TypingEngine(self.current_quote.text)
+                        ghosts = self.load_ghosts(self.current_quote)
                         timer_started = False
                     elif key == readchar.key.BACKSPACE or key == '\x7f':
                         engine.remove_character()
@@ -223,17 +249,28 @@ class TypingTest:
                     pass
         
         engine.end()
+        # Only a run that ends with the quote typed exactly can set a ghost to race
+        if self.current_quote.id and engine.user_input == engine.target_text:
+            save_ghost(self.current_quote.id, engine.timeline)
         self.show_results(engine)
     
+    def load_ghosts(self, quote: Quote) -> List[Ghost]:
+        """Load the ghosts to race against for a quote when ghost mode is on"""
+        if not self.ghost_mode or not quote.id:
+            return []
+        ghost = load_ghost(quote.id)
+        return [ghost] if ghost else []
+    
     def show_results(self, engine: TypingEngine):
         """Display test results with enhanced UI"""
         console.clear()
         self.show_banner()
         
-        wpm = engine.calculate_wpm()
-        accuracy = engine.calculate_accuracy()
-        errors = engine.calculate_errors()
-        time_taken = engine.get_elapsed_time()
+        summary = engine.get_results_summary()
+        wpm = summary.wpm
+        accuracy = summary.accuracy
+        errors = summary.errors
+        time_taken = summary.time_taken
         
         results_content = Text()
         results_content.append("Words Per Minute: ", style="cyan")
@@ -258,7 +295,7 @@ class TypingTest:
         console.print(Align.center(results_panel))
         console.print()
         
-        self.show_word_history(engine)
+        self.show_word_history(summary)
         
         console.print(Align.center("[cyan]Save to leaderboard? (y/n)[/]"))
         try:
@@ -276,9 +313,9 @@ class TypingTest:
         console.print("\n[dim]Press any key to return to menu...[/]")
         readchar.readchar()
     
-    def show_word_history(self, engine: TypingEngine):
+    def show_word_history(self, summary: ResultsSummary):
         """Display word-by-word typing history"""
-        word_history = engine.get_word_history()
+        word_history = summary.word_history
         
         if not word_history:
             return
@@ -296,14 +333,14 @@ class TypingTest:
         history_table.add_column("✓/✗", justify="center", width=5)
         
         for i, word_stat in enumerate(word_history[:15], 1):
-            status = "✓" if word_stat['correct'] else "✗"
-            status_style = "green" if word_stat['correct'] else "red"
+            status = "✓" if word_stat.correct else "✗"
+            status_style = "green" if word_stat.correct else "red"
             
             history_table.add_row(
                 str(i),
-                word_stat['word'][:20],
-                word_stat['typed'][:20] if word_stat['typed'] else "[dim]skipped[/]",
-                f"{word_stat['accuracy']:.0f}%",
+                word_stat.word[:20],
+                word_stat.typed[:20] if word_stat.typed else "[dim]skipped[/]",
+                f"{word_stat.accuracy:.0f}%",
                 f"[{status_style}]{status}[/]"
             )
         
@@ -336,7 +373,9 @@ class TypingTest:
         filter_content.append("4. ", style="bold yellow")
         filter_content.append("Long\n", style="magenta")
         filter_content.append("5. ", style="bold yellow")
-        filter_content.append("Very Long", style="red")
+        filter_content.append("Very Long\n\n", style="red")
+        filter_content.append("6. ", style="bold yellow")
+        filter_content.append("Player Stats", style="bright_cyan")
         
         filter_panel = Panel(
             filter_content,
@@ -358,6 +397,9 @@ class TypingTest:
                 filter_length = "long"
             elif choice == '5':
                 filter_length = "very_long"
+            elif choice == '6':
+                self.show_player_stats()
+                return
         except:
             pass
         
@@ -417,6 +459,62 @@ class TypingTest:
         console.print("\n[dim center]Press any key to return to menu...[/]")
         readchar.readchar()
     
+    def show_player_stats(self):
+        """Display per-player averages, bests and trends for each quote length"""
+        console.clear()
+        self.show_banner()
+        
+        player_stats = self.leaderboard.get_player_stats()
+        
+        if not player_stats:
+            no_stats_panel = Panel(
+                Text("No stats yet! Save a score to start tracking progress!", style="yellow", justify="center"),
+                border_style="bright_yellow",
+                box=box.HEAVY,
+                padding=(1, 2)
+            )
+            console.print(Align.center(no_stats_panel))
+        else:
+            stats_table = Table(
+                show_header=True,
+                box=box.HEAVY,
+                border_style="bright_cyan",
+                header_style="bold magenta"
+            )
+            stats_table.add_column("Name", style="cyan", width=15)
+            stats_table.add_column("Length", justify="center", style="magenta", width=10)
+            stats_table.add_column("Tests", justify="right", style="dim", width=6)
+            stats_table.add_column("Best WPM", justify="right", style="bold green", width=9)
+            stats_table.add_column("Avg WPM", justify="right", style="green", width=8)
+            stats_table.add_column("Avg Acc", justify="right", style="bold blue", width=8)
+            stats_table.add_column("Trend", justify="right", width=8)
+            
+            for stats in player_stats[:15]:
+                trend_style = "green" if stats.trend > 0 else "red" if stats.trend < 0 else "dim"
+                trend_arrow = "▲" if stats.trend > 0 else "▼" if stats.trend < 0 else "•"
+                stats_table.add_row(
+                    stats.name[:15],
+                    stats.quote_length[:8],
+                    str(stats.count),
+                    f"{stats.best_wpm:.1f}",
+                    f"{stats.mean_wpm:.1f}",
+                    f"{stats.mean_accuracy:.1f}%",
+                    f"[{trend_style}]{trend_arrow} {abs(stats.trend):.1f}[/]"
+                )
+            
+            stats_panel = Panel(
+                stats_table,
+                title="[bold cyan]📈 Player Stats 📈[/]",
+                border_style="bright_cyan",
+                box=box.HEAVY_HEAD,
+                padding=(0, 1)
+            )
+            
+            console.print(stats_panel)
+        
+        console.print("\n[dim center]Press any key to return to menu...[/]")
+        readchar.readchar()
+    
     def run(self):
         """Main application loop"""
         while True:
@@ -432,6 +530,8 @@ class TypingTest:
                 elif choice == '3':
                     self.select_quote_length()
                 elif choice == '4':
+                    self.ghost_mode = not self.ghost_mode
+                elif choice == '5':
                     console.clear()
                     goodbye_panel = Panel(
                         Text("Thanks for typing! Keep practicing! 🚀", style="bold green", justify="center"),
@@ -0,0 +1,17 @@
+"""Quote length categories shared by the quote manager and corpus tools"""
+
+from typing import Dict, Tuple
+
+LENGTH_CATEGORIES: Dict[str, Tuple[int, int]] = {
+    "short": (0, 100),
+    "medium": (101, 300),
+    "long": (301, 600),
+    "very_long": (601, 9999)
+}
+
+def get_length_category(length: int) -> str:
+    """Get the category whose length bucket contains the given length"""
+    for category, (_, max_length) in LENGTH_CATEGORIES.items():
+        if length <= max_length:
+            return category
+    return "very_long"
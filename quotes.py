@@ -5,6 +5,8 @@ import random
 from typing import Dict, List
 from dataclasses import dataclass
 
+from quote_lengths import LENGTH_CATEGORIES, get_length_category
+
 @dataclass
 class Quote:
     """Quote data structure"""
@@ -18,10 +20,7 @@ class QuoteManager:
     
     def __init__(self, json_file="english.json"):
         self.quotes_by_category: Dict[str, List[Quote]] = {
-            "short": [],
-            "medium": [],
-            "long": [],
-            "very_long": []
+            category: [] for category in LENGTH_CATEGORIES
         }
         self._load_quotes(json_file)
     
@@ -38,15 +37,7 @@ class QuoteManager:
                     length=quote_data.get('length', len(quote_data['text'])),
                     id=quote_data.get('id', 0)
                 )
-                
-                if quote.length <= 100:
-                    self.quotes_by_category["short"].append(quote)
-                elif quote.length <= 300:
-                    self.quotes_by_category["medium"].append(quote)
-                elif quote.length <= 600:
-                    self.quotes_by_category["long"].append(quote)
-                else:
-                    self.quotes_by_category["very_long"].append(quote)
+                self.quotes_by_category[get_length_category(quote.length)].append(quote)
         
         except FileNotFoundError:
             print(f"Warning: {json_file} not found, using fallback quotes")
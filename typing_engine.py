@@ -1,8 +1,33 @@
 """Core typing test engine with real-time feedback"""
 
 import time
+from dataclasses import dataclass, asdict
 from typing import List, Tuple, Dict
 
+@dataclass(frozen=True)
+class WordStat:
+    """Typing result for a single target word"""
+    word: str
+    typed: str
+    accuracy: float
+    correct: bool
+
+@dataclass(frozen=True)
+class ResultsSummary:
+    """Final statistics of a completed typing test"""
+    wpm: float
+    accuracy: float
+    errors: int
+    time_taken: float
+    word_history: Tuple[WordStat, ...]
+
+def _word_stat(target_word: str, user_word: str) -> WordStat:
+    """Compare a typed word against its target word"""
+    correct_chars = sum(1 for j, char in enumerate(user_word)
+                        if j < len(target_word) and char == target_word[j])
+    accuracy = (correct_chars / len(target_word)) * 100 if target_word else 0
+    return WordStat(target_word, user_word, round(accuracy, 1), user_word == target_word)
+
 class TypingEngine:
     def __init__(self, target_text: str):
         self.target_text = target_text
@@ -11,6 +36,7 @@ class TypingEngine:
         self.end_time = None
         self.errors = 0
         self.word_stats = []
+        self.timeline: List[float] = []
     
     def start(self):
         """Start the typing test timer"""
@@ -24,6 +50,8 @@ class TypingEngine:
         """Add a character to user input"""
         if len(self.user_input) < len(self.target_text):
             self.user_input += char
+            if self.start_time and len(self.user_input) > len(self.timeline):
+                self.timeline.append(time.time() - self.start_time)
     
     def remove_character(self):
         """Remove the last character (backspace)"""
@@ -78,35 +106,50 @@ class TypingEngine:
     
     def get_word_history(self) -> List[Dict]:
         """Get per-word typing statistics"""
+        return [asdict(word_stat) for word_stat in self.get_results_summary().word_history]
+    
+    def get_results_summary(self) -> ResultsSummary:
+        """Compute all final statistics and the word history in a single pass over the input"""
         target_words = self.target_text.split()
-        user_words = self.user_input.split()
-        
         word_history = []
-        char_index = 0
+        correct_chars = 0
+        errors = 0
+        words_typed = 0
+        word_start = None
         
-        for i, target_word in enumerate(target_words):
-            if i < len(user_words):
-                user_word = user_words[i]
-                correct_chars = sum(1 for j, char in enumerate(user_word) 
-                                  if j < len(target_word) and char == target_word[j])
-                accuracy = (correct_chars / len(target_word)) * 100 if target_word else 0
-                
-                word_history.append({
-                    'word': target_word,
-                    'typed': user_word,
-                    'accuracy': round(accuracy, 1),
-                    'correct': user_word == target_word
-                })
-            else:
-                word_history.append({
-                    'word': target_word,
-                    'typed': '',
-                    'accuracy': 0.0,
-                    'correct': False
-                })
-            char_index += len(target_word) + 1
+        for i, char in enumerate(self.user_input):
+            if i < len(self.target_text):
+                if char == self.target_text[i]:
+                    correct_chars += 1
+                else:
+                    errors += 1
+            
+            if char.isspace():
+                if word_start is not None:
+                    words_typed += 1
+                    if len(word_history) < len(target_words):
+                        target_word = target_words[len(word_history)]
+                        word_history.append(_word_stat(target_word, self.user_input[word_start:i]))
+                    word_start = None
+            elif word_start is None:
+                word_start = i
+        
+        if word_start is not None:
+            words_typed += 1
+            if len(word_history) < len(target_words):
+                target_word = target_words[len(word_history)]
+                word_history.append(_word_stat(target_word, self.user_input[word_start:]))
+        
+        for target_word in target_words[len(word_history):]:
+            word_history.append(WordStat(target_word, '', 0.0, False))
+        
+        time_taken = self.get_elapsed_time()
+        wpm = 0.0
+        if self.start_time and self.end_time and time_taken > 0:
+            wpm = words_typed / (time_taken / 60)
+        accuracy = (correct_chars / len(self.user_input)) * 100 if self.user_input else 0.0
         
-        return word_history
+        return ResultsSummary(wpm, accuracy, errors, time_taken, tuple(word_history))
     
     def get_elapsed_time(self) -> float:
         """Get elapsed time in seconds"""